@@ -3,9 +3,9 @@ ACC Telemetry Extractor - Main entry point
 Extracts throttle, brake, and steering telemetry from ACC gameplay videos.
 """
 
-import yaml
 import time
 import cv2
+import numpy as np
 import glob
 import os
 import sys
@@ -16,6 +16,7 @@ from src.telemetry_extractor import TelemetryExtractor
 from src.lap_detector import LapDetector
 from src.position_tracker_v2 import PositionTrackerV2
 from src.interactive_visualizer import InteractiveTelemetryVisualizer
+from src.config_loader import load_yaml
 
 
 class PerformanceTracker:
@@ -43,8 +44,8 @@ class PerformanceTracker:
     def print_summary(self):
         """Print detailed performance summary."""
         print(f"\n⏱️  Performance Breakdown:")
-        print(f"   {'Operation':<30} {'Total (s)':<12} {'Avg (ms)':<12} {'Min (ms)':<12} {'Max (ms)':<12} {'% of Total':<12}")
-        print(f"   {'-'*100}")
+        print(f"   {'Operation':<30} {'Total (s)':<12} {'Avg (ms)':<12} {'Median (ms)':<12} {'P95 (ms)':<12} {'Min (ms)':<12} {'Max (ms)':<12} {'% of Total':<12}")
+        print(f"   {'-'*124}")
         
         total_time = sum(sum(times) for times in self.timings.values())
         
@@ -52,6 +53,8 @@ class PerformanceTracker:
             if times:
                 total_s = sum(times) / 1000
                 avg_ms = sum(times) / len(times)
+                # Median/P95 are robust to the occasional slow frame (seek, GC, OCR outlier)
+                median_ms, p95_ms = np.percentile(times, [50, 95])
                 min_ms = min(times)
                 max_ms = max(times)
                 percentage = (sum(times) / total_time) * 100 if total_time > 0 else 0
@@ -59,9 +62,9 @@ class PerformanceTracker:
                 # Format step name (remove underscores, capitalize)
                 step_name = step.replace('_', ' ').title()
                 
-                print(f"   {step_name:<30} {total_s:<12.2f} {avg_ms:<12.2f} {min_ms:<12.2f} {max_ms:<12.2f} {percentage:<12.1f}%")
+                print(f"   {step_name:<30} {total_s:<12.2f} {avg_ms:<12.2f} {median_ms:<12.2f} {p95_ms:<12.2f} {min_ms:<12.2f} {max_ms:<12.2f} {percentage:<12.1f}%")
         
-        print(f"   {'-'*100}")
+        print(f"   {'-'*124}")
         print(f"   {'TOTAL':<30} {total_time/1000:<12.2f}")
         print(f"\n   Per-frame average: {(total_time/len(self.timings['frame_processing']) if self.timings['frame_processing'] else 0):.2f}ms")
         print(f"   Frames processed: {self.total_frames}")
@@ -71,8 +74,7 @@ class PerformanceTracker:
 
 def load_config(config_path: str = 'config/roi_config.yaml'):
     """Load ROI configuration from YAML file."""
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return load_yaml(config_path)
 
 
 def select_video_file():
@@ -171,7 +173,7 @@ def main():
         return
         
     # Track total execution time
-    total_start_time = time.time()
+    total_start_time = time.perf_counter()
     
     # Initialize components
     print(f"\n🎥 Opening video: {VIDEO_PATH}")
@@ -210,19 +212,10 @@ def main():
         # Sample multiple frames to get complete path (avoid red dot occlusion)
         # Sample more frames to ensure we get enough clean ones after noise filtering
         sample_frames = [0, 50, 100, 150, 200, 250, 500, 750, 1000, 1250, 1500]
-        map_rois = []
+        sample_frames = [f for f in sample_frames if f < video_info['frame_count']]
         
-        for sample_frame_num in sample_frames:
-            if sample_frame_num >= video_info['frame_count']:
-                break
-            
-            # Seek to frame and read
-            processor.cap.set(cv2.CAP_PROP_POS_FRAMES, sample_frame_num)
-            ret, frame = processor.cap.read()
-            
-            if ret:
-                map_roi = processor.extract_roi(frame, 'track_map')
-                map_rois.append(map_roi)
+        # Grabs forward across short gaps, seeks across long ones
+        map_rois = processor.sample_rois(sample_frames, 'track_map')
         
         # Reset video to start
         processor.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
@@ -241,7 +234,7 @@ def main():
     perf_tracker = PerformanceTracker()
     
     telemetry_data = []
-    last_progress = -1
+    next_progress = 0  # Next 10% progress mark to report
     previous_lap = None
     lap_transitions = []  # Track lap transition frames
     completed_lap_times = {}  # Map lap_number -> lap_time for completed laps
@@ -249,37 +242,37 @@ def main():
     
     try:
         for frame_num, timestamp, roi_dict in processor.process_frames():
-            frame_start = time.time()
+            frame_start = time.perf_counter()
             
             # Extract telemetry from current frame
-            telemetry_start = time.time()
+            telemetry_start = time.perf_counter()
             telemetry = extractor.extract_frame_telemetry(roi_dict)
-            perf_tracker.record('telemetry_extraction', time.time() - telemetry_start)
+            perf_tracker.record('telemetry_extraction', time.perf_counter() - telemetry_start)
             
             # Extract lap number
-            lap_start = time.time()
+            lap_start = time.perf_counter()
             lap_number = lap_detector.extract_lap_number(processor.current_frame)
-            perf_tracker.record('lap_number_detection', time.time() - lap_start)
+            perf_tracker.record('lap_number_detection', time.perf_counter() - lap_start)
             
             # Extract speed
-            speed_start = time.time()
+            speed_start = time.perf_counter()
             speed = lap_detector.extract_speed(processor.current_frame)
-            perf_tracker.record('speed_extraction', time.time() - speed_start)
+            perf_tracker.record('speed_extraction', time.perf_counter() - speed_start)
             
             # Extract gear
-            gear_start = time.time()
+            gear_start = time.perf_counter()
             gear = lap_detector.extract_gear(processor.current_frame)
-            perf_tracker.record('gear_extraction', time.time() - gear_start)
+            perf_tracker.record('gear_extraction', time.perf_counter() - gear_start)
             
             # Extract track position
-            position_start = time.time()
+            position_start = time.perf_counter()
             track_position = None
             if 'track_map' in roi_dict and position_tracker.is_ready():
                 track_position = position_tracker.extract_position(roi_dict['track_map'])
-            perf_tracker.record('position_tracking', time.time() - position_start)
+            perf_tracker.record('position_tracking', time.perf_counter() - position_start)
             
             # Detect lap transitions
-            transition_start = time.time()
+            transition_start = time.perf_counter()
             if lap_detector.detect_lap_transition(lap_number, previous_lap):
                 # Lap transition detected - mark to read lap time on NEXT frame
                 frames_since_transition = 1  # Will trigger lap time read on next iteration
@@ -301,9 +294,9 @@ def main():
                 })
             elif frames_since_transition == 1:
                 # This is the FIRST frame after lap transition - read LAST lap time
-                lap_time_start = time.time()
+                lap_time_start = time.perf_counter()
                 completed_lap_time = lap_detector.extract_last_lap_time(processor.current_frame)
-                perf_tracker.record('lap_time_extraction', time.time() - lap_time_start)
+                perf_tracker.record('lap_time_extraction', time.perf_counter() - lap_time_start)
                 
                 if completed_lap_time and previous_lap is not None:
                     completed_lap_times[previous_lap] = completed_lap_time
@@ -313,10 +306,10 @@ def main():
                         lap_transitions[-1]['completed_lap_time'] = completed_lap_time
                 
                 frames_since_transition = 0  # Reset counter
-            perf_tracker.record('lap_transition_detection', time.time() - transition_start)
+            perf_tracker.record('lap_transition_detection', time.perf_counter() - transition_start)
             
             # Store data (lap_time will be filled in post-processing)
-            storage_start = time.time()
+            storage_start = time.perf_counter()
             telemetry_data.append({
                 'frame': frame_num,
                 'time': timestamp,
@@ -331,19 +324,22 @@ def main():
                 'tc_active': telemetry['tc_active'],
                 'abs_active': telemetry['abs_active']
             })
-            perf_tracker.record('data_storage', time.time() - storage_start)
+            perf_tracker.record('data_storage', time.perf_counter() - storage_start)
             
             previous_lap = lap_number
             perf_tracker.total_frames += 1
             
             # Record total frame processing time
-            perf_tracker.record('frame_processing', time.time() - frame_start)
+            perf_tracker.record('frame_processing', time.perf_counter() - frame_start)
             
-            # Progress indicator
-            progress = int((frame_num / video_info['frame_count']) * 100)
-            if progress % 10 == 0 and progress != last_progress:
-                print(f"   Progress: {progress}% ({frame_num}/{video_info['frame_count']} frames)")
-                last_progress = progress
+            # Progress indicator (integer compare against the next 10% mark,
+            # percentage only computed once that mark is reached). Short videos
+            # can jump past a mark, so only exact multiples of 10 are printed.
+            if frame_num * 100 >= next_progress * video_info['frame_count']:
+                progress = int((frame_num / video_info['frame_count']) * 100)
+                if progress % 10 == 0:
+                    print(f"   Progress: {progress}% ({frame_num}/{video_info['frame_count']} frames)")
+                next_progress = progress // 10 * 10 + 10
         
         print(f"   ✅ Processing complete! Extracted {len(telemetry_data)} frames")
         
@@ -402,20 +398,20 @@ def main():
     # Create DataFrame
     print(f"\n📈 Generating outputs...")
     
-    df_start = time.time()
+    df_start = time.perf_counter()
     df = visualizer.create_dataframe(telemetry_data)
-    df_time = time.time() - df_start
+    df_time = time.perf_counter() - df_start
     
     # Export CSV
-    csv_start = time.time()
+    csv_start = time.perf_counter()
     csv_path = visualizer.export_csv(df)
-    csv_time = time.time() - csv_start
+    csv_time = time.perf_counter() - csv_start
     print(f"   ✅ CSV saved: {csv_path} (took {csv_time*1000:.1f}ms)")
     
     # Generate interactive HTML graph
-    graph_start = time.time()
+    graph_start = time.perf_counter()
     graph_path = visualizer.plot_telemetry(df)
-    graph_time = time.time() - graph_start
+    graph_time = time.perf_counter() - graph_start
     print(f"   ✅ Interactive graph saved: {graph_path} (took {graph_time:.2f}s)")
     print(f"      💡 Open this HTML file in your browser for interactive zoom/pan/hover!")
 
@@ -463,7 +459,7 @@ def main():
     print("=" * 60)
     
     # Display total execution time
-    total_time = time.time() - total_start_time
+    total_time = time.perf_counter() - total_start_time
     print(f"\n⏱️  Total Execution Time: {total_time:.2f}s ({total_time/60:.1f} minutes)")
 
 
@@ -0,0 +1,22 @@
+"""
+YAML configuration loading shared by the CLI, the web service and calibration tools.
+"""
+
+import yaml
+
+# LibYAML-backed loader when PyYAML was built with it (much faster), pure-Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_yaml(path) -> dict:
+    """
+    Safely load a YAML file.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML content
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
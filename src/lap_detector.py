@@ -5,22 +5,125 @@ Uses direct OCR with minimal preprocessing for fast and accurate digit recogniti
 Performance: tesserocr (1-2ms) >> pytesseract (50ms) > template matching (2ms)
 """
 
+import atexit
+import os
 import cv2
 import numpy as np
 import re
-from typing import Optional, Tuple
+import statistics
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 from src.template_matcher import TemplateMatcher
 
+# Tesseract's OpenMP threading only adds overhead on tiny per-frame ROIs.
+# Must be set before libtesseract is loaded; an explicit user value wins.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 # Try to use fast tesserocr (direct C++ API), fall back to pytesseract
 try:
     import tesserocr
-    from PIL import Image
     USE_TESSEROCR = True
 except ImportError:
-    import pytesseract
     USE_TESSEROCR = False
 
+# pytesseract is the fallback path (also used if tesserocr fails to initialize),
+# so it is only mandatory when tesserocr is unavailable
+try:
+    import pytesseract
+except ImportError:
+    if not USE_TESSEROCR:
+        raise
+    pytesseract = None
+
+
+# One tesserocr engine per thread (see _get_tesserocr_api)
+_tesserocr_local = threading.local()
+
+
+def _get_tesserocr_api() -> 'tesserocr.PyTessBaseAPI':
+    """
+    Get this thread's tesserocr API, creating it on first use.
+    
+    Loading Tesseract's trained data takes ~380ms, so every LapDetector on a
+    thread shares one initialized engine instead of paying that per instance.
+    The API is released at interpreter exit.
+    
+    The API itself is not thread-safe (detectors temporarily change the
+    whitelist and page segmentation mode), so each thread gets its own
+    engine - e.g. concurrent web processing jobs running in worker threads.
+    
+    Returns:
+        Initialized PyTessBaseAPI with the digit-only whitelist set
+    """
+    api = getattr(_tesserocr_local, 'api', None)
+    if api is not None:
+        return api
+    
+    # Try common paths for tessdata
+    tessdata_paths = [
+        '/opt/homebrew/share/tessdata/',  # macOS Homebrew
+        '/usr/share/tesseract-ocr/4.00/tessdata/',  # Linux/Docker (older)
+        '/usr/share/tesseract-ocr/5/tessdata/',  # Linux/Docker (newer)
+        '/usr/share/tesseract-ocr/tessdata/',  # Linux generic
+        '/usr/share/tessdata/',  # Linux alternative
+    ]
+    
+    tessdata_path = None
+    print(f"🔍 Searching for tessdata in: {tessdata_paths}")
+    for path in tessdata_paths:
+        if Path(path).exists():
+            tessdata_path = path
+            print(f"✅ Found tessdata at: {path}")
+            break
+    
+    # Word dictionaries are useless for digit-only HUD fields; they are
+    # init-only variables, so they must be disabled at construction time
+    init_variables = {'load_system_dawg': 'F', 'load_freq_dawg': 'F'}
+    
+    if tessdata_path:
+        print(f"DEBUG: Initializing PyTessBaseAPI with path: {tessdata_path}")
+        api = tesserocr.PyTessBaseAPI(
+            path=tessdata_path,
+            psm=tesserocr.PSM.SINGLE_WORD,
+            oem=tesserocr.OEM.LSTM_ONLY,
+            variables=init_variables
+        )
+        print("DEBUG: PyTessBaseAPI initialized successfully")
+    else:
+        # Let tesserocr find it (default behavior)
+        print("DEBUG: Initializing PyTessBaseAPI with default path")
+        api = tesserocr.PyTessBaseAPI(
+            psm=tesserocr.PSM.SINGLE_WORD,
+            oem=tesserocr.OEM.LSTM_ONLY,
+            variables=init_variables
+        )
+        print("DEBUG: PyTessBaseAPI initialized successfully (default)")
+    
+    api.SetVariable("tessedit_char_whitelist", "0123456789")
+    atexit.register(api.End)
+    _tesserocr_local.api = api
+    return api
+
+
+# OCR noise stripper: everything that is not a digit
+_NON_DIGIT = re.compile(r'\D+')
+
+
+def _parse_digits(text: str) -> Optional[int]:
+    """
+    Parse an integer from OCR output, ignoring any non-digit noise.
+    
+    Args:
+        text: Raw OCR text
+        
+    Returns:
+        Integer formed by the digits in text, or None if there are none
+    """
+    digits_only = _NON_DIGIT.sub('', text)
+    return int(digits_only) if digits_only else None
+
 
 class LapDetector:
     """
@@ -82,6 +185,9 @@ class LapDetector:
         # Tesseract config for lap times (still using OCR for complex time format)
         self.tesseract_config_time = '--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789:.'
         
+        # Tesseract config for gear (single digit 1-6)
+        self.tesseract_config_gear = '--psm 8 --oem 3 -c tessedit_char_whitelist=123456'
+        
         # Check if templates are loaded
         if not self.lap_matcher.has_templates():
             print(f"⚠️  Warning: No lap number templates found in {template_dir}")
@@ -89,43 +195,11 @@ class LapDetector:
         
         # Initialize tesserocr API (much faster than pytesseract)
         self._tesserocr_api = None
+        # Grayscale scratch buffers for OCR input, one per ROI shape (reused every frame)
+        self._ocr_gray_buffers: Dict[Tuple[int, int], np.ndarray] = {}
         if USE_TESSEROCR:
             try:
-                # Try common paths for tessdata
-                tessdata_paths = [
-                    '/opt/homebrew/share/tessdata/',  # macOS Homebrew
-                    '/usr/share/tesseract-ocr/4.00/tessdata/',  # Linux/Docker (older)
-                    '/usr/share/tesseract-ocr/5/tessdata/',  # Linux/Docker (newer)
-                    '/usr/share/tesseract-ocr/tessdata/',  # Linux generic
-                    '/usr/share/tessdata/',  # Linux alternative
-                ]
-                
-                tessdata_path = None
-                print(f"🔍 Searching for tessdata in: {tessdata_paths}")
-                for path in tessdata_paths:
-                    if Path(path).exists():
-                        tessdata_path = path
-                        print(f"✅ Found tessdata at: {path}")
-                        break
-                
-                if tessdata_path:
-                    print(f"DEBUG: Initializing PyTessBaseAPI with path: {tessdata_path}")
-                    self._tesserocr_api = tesserocr.PyTessBaseAPI(
-                        path=tessdata_path,
-                        psm=tesserocr.PSM.SINGLE_WORD,
-                        oem=tesserocr.OEM.LSTM_ONLY
-                    )
-                    print("DEBUG: PyTessBaseAPI initialized successfully")
-                else:
-                    # Let tesserocr find it (default behavior)
-                    print("DEBUG: Initializing PyTessBaseAPI with default path")
-                    self._tesserocr_api = tesserocr.PyTessBaseAPI(
-                        psm=tesserocr.PSM.SINGLE_WORD,
-                        oem=tesserocr.OEM.LSTM_ONLY
-                    )
-                    print("DEBUG: PyTessBaseAPI initialized successfully (default)")
-                    
-                self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789")
+                self._tesserocr_api = _get_tesserocr_api()
                 print("✅ Using tesserocr (fast C++ API, ~2ms per frame)")
             except Exception as e:
                 print(f"⚠️  tesserocr init failed: {e}, falling back to pytesseract")
@@ -153,6 +227,22 @@ class LapDetector:
         
         # Extract ROI
         roi = self._extract_roi(frame, self.lap_number_roi)
+        return self.extract_lap_number_from_roi(roi)
+    
+    def extract_lap_number_from_roi(self, roi: np.ndarray) -> Optional[int]:
+        """
+        Extract lap number from an already-cropped lap number ROI.
+        
+        Same as extract_lap_number() but skips the frame crop, so callers that
+        already hold the ROI (or feed the same ROI repeatedly to probe the
+        history buffer) don't pay for re-extracting it on every call.
+        
+        Args:
+            roi: Lap number ROI (BGR format), as returned by _extract_roi()
+            
+        Returns:
+            Lap number as integer, or None if extraction fails
+        """
         if roi is None or roi.size == 0:
             return self._last_valid_lap_number
         
@@ -164,21 +254,17 @@ class LapDetector:
         # Run OCR directly on raw BGR ROI
         # No preprocessing needed - Tesseract handles color images perfectly
         try:
-            import time
-            ocr_start = time.time()
+            ocr_start = time.perf_counter()
             
             if self._tesserocr_api:
                 # Fast path: tesserocr (1-2ms)
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(roi_rgb)
-                self._tesserocr_api.SetImage(pil_image)
+                self._set_ocr_image(roi)
                 text = self._tesserocr_api.GetUTF8Text()
             else:
                 # Slow path: pytesseract (50ms)
-                import pytesseract
                 text = pytesseract.image_to_string(roi, config=self.tesseract_config_lap)
             
-            ocr_time = (time.time() - ocr_start) * 1000
+            ocr_time = (time.perf_counter() - ocr_start) * 1000
             text = text.strip()
             
             # Debug: print OCR results (disabled by default for cleaner output)
@@ -186,18 +272,25 @@ class LapDetector:
             #     print(f"[DEBUG Frame {self._total_frames_processed}] OCR took {ocr_time:.2f}ms - result: '{text}'")
             
             # Parse lap number (should be 1-2 digits)
-            if text.isdigit():
-                lap_number = int(text)
-            else:
-                # Try to extract digits from text (in case of noise)
-                digits_only = ''.join(filter(str.isdigit, text))
-                if digits_only:
-                    lap_number = int(digits_only)
-                else:
-                    lap_number = None
+            lap_number = _parse_digits(text)
         except Exception as e:
             lap_number = None
         
+        return self._push_lap_number(lap_number)
+    
+    def _push_lap_number(self, lap_number: Optional[int]) -> Optional[int]:
+        """
+        Feed a raw OCR reading into the lap number history and validation.
+        
+        Split out from OCR so the temporal smoothing can be driven directly
+        with a known reading (no ROI crop or OCR per call).
+        
+        Args:
+            lap_number: Raw OCR lap number, or None if OCR failed
+            
+        Returns:
+            Smoothed and validated lap number, or last known good value
+        """
         if lap_number is not None:
             # Validate: lap numbers should be reasonable (0-999)
             # Lap 0 = on grid/warmup, laps 1+ = racing laps
@@ -314,22 +407,19 @@ class LapDetector:
         try:
             if self._tesserocr_api:
                 # Fast path: tesserocr (1-2ms)
-                # Need to convert grayscale to RGB for PIL
-                resized_rgb = cv2.cvtColor(resized, cv2.COLOR_GRAY2RGB)
-                pil_image = Image.fromarray(resized_rgb)
-                
                 # Temporarily set character whitelist for time format
                 self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789:.")
                 self._tesserocr_api.SetPageSegMode(tesserocr.PSM.SINGLE_LINE)
-                self._tesserocr_api.SetImage(pil_image)
-                text = self._tesserocr_api.GetUTF8Text()
-                
-                # Reset to digit-only for lap numbers
-                self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789")
-                self._tesserocr_api.SetPageSegMode(tesserocr.PSM.SINGLE_WORD)
+                try:
+                    self._set_ocr_image(resized)
+                    text = self._tesserocr_api.GetUTF8Text()
+                finally:
+                    # Reset to digit-only for lap numbers, even if OCR failed:
+                    # the engine is shared by every detector on this thread
+                    self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789")
+                    self._tesserocr_api.SetPageSegMode(tesserocr.PSM.SINGLE_WORD)
             else:
                 # Slow path: pytesseract (50ms)
-                import pytesseract
                 text = pytesseract.image_to_string(resized, config=self.tesseract_config_time)
             
             text = text.strip()
@@ -377,6 +467,34 @@ class LapDetector:
         # Lap transition occurs when lap number increases by 1
         return current_lap == previous_lap + 1
     
+    def _set_ocr_image(self, image: np.ndarray) -> None:
+        """
+        Hand an image to tesserocr as raw 8-bit grayscale bytes.
+        
+        Skips the BGR->RGB conversion and PIL copy that SetImage() needs.
+        Results may differ slightly from passing the color ROI: Tesseract
+        binarizes color input per channel, and its own grayscale weights differ
+        from cv2.COLOR_BGR2GRAY. Validate lap/speed/gear reads on real frames
+        after changing this conversion.
+        The grayscale conversion writes into a per-shape buffer that is reused
+        across frames instead of allocating a new array every call.
+        
+        Args:
+            image: BGR image or single-channel grayscale image
+        """
+        if image.ndim == 3:
+            shape = image.shape[:2]
+            gray = self._ocr_gray_buffers.get(shape)
+            if gray is None:
+                gray = np.empty(shape, dtype=np.uint8)
+                self._ocr_gray_buffers[shape] = gray
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+        else:
+            image = np.ascontiguousarray(image)
+        
+        height, width = image.shape
+        self._tesserocr_api.SetImageBytes(image.tobytes(), width, height, 1, width)
+    
     def _extract_roi(self, frame: np.ndarray, roi_config: dict) -> Optional[np.ndarray]:
         """
         Extract Region of Interest from frame.
@@ -436,27 +554,16 @@ class LapDetector:
         try:
             if self._tesserocr_api:
                 # Fast path: tesserocr (1-2ms)
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(roi_rgb)
-                self._tesserocr_api.SetImage(pil_image)
+                self._set_ocr_image(roi)
                 text = self._tesserocr_api.GetUTF8Text()
             else:
                 # Slow path: pytesseract (50ms)
-                import pytesseract
                 text = pytesseract.image_to_string(roi, config=self.tesseract_config_lap)
             
             text = text.strip()
             
             # Parse speed (should be 1-3 digits)
-            if text.isdigit():
-                speed = int(text)
-            else:
-                # Try to extract digits from text (in case of noise)
-                digits_only = ''.join(filter(str.isdigit, text))
-                if digits_only:
-                    speed = int(digits_only)
-                else:
-                    speed = None
+            speed = _parse_digits(text)
         except Exception as e:
             speed = None
         
@@ -491,7 +598,6 @@ class LapDetector:
             return None
         
         # Use median to filter outliers (more robust than mean)
-        import statistics
         return int(statistics.median(self._speed_history))
     
     def extract_gear(self, frame: np.ndarray) -> Optional[int]:
@@ -520,34 +626,23 @@ class LapDetector:
         try:
             if self._tesserocr_api:
                 # Fast path: tesserocr (1-2ms)
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(roi_rgb)
-                
                 # Temporarily set character whitelist for gears (1-6)
                 self._tesserocr_api.SetVariable("tessedit_char_whitelist", "123456")
-                self._tesserocr_api.SetImage(pil_image)
-                text = self._tesserocr_api.GetUTF8Text()
-                
-                # Reset to digit-only (0-9) for lap numbers/speed
-                self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789")
+                try:
+                    self._set_ocr_image(roi)
+                    text = self._tesserocr_api.GetUTF8Text()
+                finally:
+                    # Reset to digit-only (0-9) for lap numbers/speed, even if OCR
+                    # failed: the engine is shared by every detector on this thread
+                    self._tesserocr_api.SetVariable("tessedit_char_whitelist", "0123456789")
             else:
                 # Slow path: pytesseract (50ms)
-                import pytesseract
-                tesseract_config_gear = '--psm 8 --oem 3 -c tessedit_char_whitelist=123456'
-                text = pytesseract.image_to_string(roi, config=tesseract_config_gear)
+                text = pytesseract.image_to_string(roi, config=self.tesseract_config_gear)
             
             text = text.strip()
             
             # Parse gear (should be single digit 1-6)
-            if text.isdigit():
-                gear = int(text)
-            else:
-                # Try to extract digits from text (in case of noise)
-                digits_only = ''.join(filter(str.isdigit, text))
-                if digits_only:
-                    gear = int(digits_only)
-                else:
-                    gear = None
+            gear = _parse_digits(text)
         except Exception as e:
             gear = None
         
@@ -677,14 +772,13 @@ class LapDetector:
     
     def close(self):
         """
-        Clean up resources (close tesserocr API if initialized).
-        Call this when done processing to free resources.
+        Release this detector's handle on the tesserocr API.
+        
+        The API itself is shared by all detectors on the thread (see
+        _get_tesserocr_api) and is ended at interpreter exit, so other
+        detectors can keep using it.
         """
-        if self._tesserocr_api:
-            try:
-                self._tesserocr_api.End()
-            except:
-                pass
+        self._tesserocr_api = None
     
     def __del__(self):
         """Destructor to ensure cleanup."""
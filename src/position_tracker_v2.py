@@ -38,7 +38,10 @@ class PositionTrackerV2:
                                At 30 FPS, a full lap takes ~100 seconds, so 1% = 1 second of track
                                This allows for normal speed variations while rejecting obvious outliers
         """
-        self.track_path: Optional[List[Tuple[int, int]]] = None
+        self._track_path: Optional[List[Tuple[int, int]]] = None  # Racing line points (see track_path)
+        self._track_path_np: Optional[np.ndarray] = None  # Cached (N, 2) int32 copy of track_path
+        self._track_path_np_source: Optional[List[Tuple[int, int]]] = None  # track_path the cache was built from
+        self._track_path_cumdist: Optional[np.ndarray] = None  # Cached cumulative arc length along track_path
         self.total_path_pixels: int = 0  # Total number of pixels in the racing line path
         self.total_track_length: float = 0.0  # Total arc length of racing line (cached)
         self.start_position: Optional[Tuple[int, int]] = None  # (x, y) where lap starts (set on lap change)
@@ -66,6 +69,81 @@ class PositionTrackerV2:
         self.red_lower2 = np.array([170, 150, 150])
         self.red_upper2 = np.array([180, 255, 255])
     
+    @property
+    def track_path(self) -> Optional[List[Tuple[int, int]]]:
+        """
+        Racing line as an ordered list of (x, y) pixel points, or None if not extracted.
+
+        May be assigned either a list of (x, y) tuples (kept as-is) or an (N, 2)
+        array, which is converted to a list of integer tuples.
+        """
+        return self._track_path
+
+    @track_path.setter
+    def track_path(self, path) -> None:
+        if isinstance(path, np.ndarray):
+            path = [tuple(p) for p in np.asarray(path, dtype=np.int64).reshape(-1, 2).tolist()]
+        self._track_path = path
+
+    @property
+    def track_path_np(self) -> Optional[np.ndarray]:
+        """
+        Racing line as an (N, 2) int32 array, for vectorized consumers.
+
+        Built once from track_path and reused until track_path is replaced or
+        resized, so callers don't each re-convert the list of tuples.
+
+        Returns:
+            Array of (x, y) points, or None if no path is set
+        """
+        if self.track_path is None:
+            return None
+
+        if (self._track_path_np is None
+                or self._track_path_np_source is not self.track_path
+                or len(self._track_path_np) != len(self.track_path)):
+            self._track_path_np = np.asarray(self.track_path, dtype=np.int32).reshape(-1, 2)
+            self._track_path_np_source = self.track_path
+            self._track_path_cumdist = None
+
+        return self._track_path_np
+
+    @property
+    def track_path_cumdist(self) -> Optional[np.ndarray]:
+        """
+        Cumulative arc length lookup table for track_path.
+
+        Element i is the distance along the path from track_path[0] to
+        track_path[i], so any arc length is a difference of two lookups instead
+        of a per-frame walk over the path. Cached together with track_path_np.
+
+        Returns:
+            Float64 array of length N (first element 0.0), or None if no path is set
+        """
+        path = self.track_path_np  # Refreshes (and invalidates) the cache if track_path changed
+        if path is None:
+            return None
+
+        if self._track_path_cumdist is None:
+            segment_lengths = np.hypot(*np.diff(path, axis=0).T.astype(np.float64))
+            self._track_path_cumdist = np.concatenate(([0.0], np.cumsum(segment_lengths)))
+
+        return self._track_path_cumdist
+
+    def _closed_path_length(self) -> float:
+        """
+        Total arc length of track_path as a closed loop (including last -> first).
+
+        Returns:
+            Loop length in pixels (0.0 if no path is set)
+        """
+        if not self.track_path:
+            return 0.0
+
+        path = self.track_path_np
+        closing = float(np.hypot(*(path[0] - path[-1]).astype(np.float64)))
+        return float(self.track_path_cumdist[-1]) + closing
+
     def extract_track_path(self, map_rois: List[np.ndarray], frequency_threshold: float = 0.45) -> bool:
         """
         Extract the white racing line using multi-frame frequency voting.
@@ -113,12 +191,13 @@ class PositionTrackerV2:
         
         # STEP 2: Calculate pixel-wise frequency (how often is each pixel white?)
         print(f"   Step 2: Computing pixel-wise white frequency...")
-        mask_stack = np.stack(white_masks, axis=2).astype(np.float32)
-        white_frequency = np.sum(mask_stack > 0, axis=2) / len(white_masks)
+        # Count on the uint8 stack directly (one pass, no float32 copy of every mask)
+        mask_stack = np.stack(white_masks, axis=0)
+        white_frequency = np.count_nonzero(mask_stack, axis=0) / len(white_masks)
         
         # Threshold by frequency (racing line is consistently white)
         racing_line_raw = (white_frequency >= frequency_threshold).astype(np.uint8) * 255
-        raw_pixels = np.sum(racing_line_raw > 0)
+        raw_pixels = cv2.countNonZero(racing_line_raw)
         print(f"      ✅ Raw outline: {raw_pixels} pixels")
         
         # STEP 3: Dilate-Filter-Erode to remove artifacts
@@ -156,7 +235,7 @@ class PositionTrackerV2:
         
         # Intersect with raw to ensure accuracy (don't add false pixels)
         cleaned_mask = cv2.bitwise_and(eroded, racing_line_raw)
-        cleaned_pixels = np.sum(cleaned_mask > 0)
+        cleaned_pixels = cv2.countNonZero(cleaned_mask)
         
         print(f"      ✅ Cleaned racing line: {cleaned_pixels} pixels ({cleaned_pixels/raw_pixels*100:.1f}% of raw)")
         
@@ -195,19 +274,13 @@ class PositionTrackerV2:
         self.total_path_pixels = len(path_points)
 
         # Calculate track center as the centroid of all path points
-        path_array = np.array(self.track_path)
+        path_array = self.track_path_np
         center_x = np.mean(path_array[:, 0])
         center_y = np.mean(path_array[:, 1])
         self.track_center = (center_x, center_y)
 
         # Calculate total track length (arc length of racing line)
-        self.total_track_length = 0.0
-        for i in range(len(self.track_path)):
-            p1 = self.track_path[i]
-            p2 = self.track_path[(i + 1) % len(self.track_path)]  # Wrap around
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            self.total_track_length += np.sqrt(dx*dx + dy*dy)
+        self.total_track_length = self._closed_path_length()  # Includes wrap-around segment
 
         self.path_extracted = True
 
@@ -236,24 +309,11 @@ class PositionTrackerV2:
                 self.total_path_pixels = len(cleaned_path)
 
                 # Recalculate total track length
-                self.total_track_length = 0.0
-                for i in range(len(self.track_path)):
-                    p1 = self.track_path[i]
-                    p2 = self.track_path[(i + 1) % len(self.track_path)]
-                    dx = p2[0] - p1[0]
-                    dy = p2[1] - p1[1]
-                    self.total_track_length += np.sqrt(dx*dx + dy*dy)
+                self.total_track_length = self._closed_path_length()
 
                 # Update start_idx (it may have shifted slightly)
                 # Find the point closest to the original start_position
-                min_dist = float('inf')
-                for i, pt in enumerate(self.track_path):
-                    dx = pt[0] - self.start_position[0]
-                    dy = pt[1] - self.start_position[1]
-                    dist = dx*dx + dy*dy
-                    if dist < min_dist:
-                        min_dist = dist
-                        self.start_idx = i
+                self.start_idx = self._find_closest_path_index(*self.start_position)
 
                 print(f"      ✅ Removed {old_length - len(cleaned_path)} artifact points")
                 print(f"      ✅ New track length: {self.total_track_length:.1f} pixels")
@@ -299,7 +359,7 @@ class PositionTrackerV2:
         if not self.track_path or len(self.track_path) < 50:
             return None, 0.0, None
 
-        path_array = np.array(self.track_path, dtype=np.float32)
+        path_array = self.track_path_np.astype(np.float32)
         num_points = len(path_array)
 
         # STEP 1: Calculate smoothed tangent direction at each point
@@ -501,7 +561,7 @@ class PositionTrackerV2:
             return False
         
         # Check if path has reasonable shape (not just a straight line)
-        path_array = np.array(self.track_path)
+        path_array = self.track_path_np
         x_range = np.max(path_array[:, 0]) - np.min(path_array[:, 0])
         y_range = np.max(path_array[:, 1]) - np.min(path_array[:, 1])
         
@@ -532,8 +592,8 @@ class PositionTrackerV2:
         red_mask1 = cv2.inRange(hsv, self.red_lower1, self.red_upper1)
         red_mask2 = cv2.inRange(hsv, self.red_lower2, self.red_upper2)
         
-        # Combine masks
-        red_mask = cv2.bitwise_or(red_mask1, red_mask2)
+        # Combine masks (in place - no third mask allocation per frame)
+        red_mask = cv2.bitwise_or(red_mask1, red_mask2, dst=red_mask1)
         
         # Find contours of red regions
         contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -559,6 +619,24 @@ class PositionTrackerV2:
         
         return (cx, cy)
     
+    def _find_closest_path_index(self, x: int, y: int) -> int:
+        """
+        Find the index of the racing line point closest to (x, y).
+
+        Vectorized over track_path_np: one NumPy pass instead of a Python loop
+        over every path point, which ran on every frame.
+
+        Args:
+            x: Query x-coordinate
+            y: Query y-coordinate
+
+        Returns:
+            Index into track_path of the closest point (first one on ties)
+        """
+        offsets = self.track_path_np - np.array([x, y], dtype=np.int32)
+        distances = np.einsum('ij,ij->i', offsets, offsets)  # Squared distance (no sqrt needed)
+        return int(np.argmin(distances))
+
     def calculate_position(self, dot_x: int, dot_y: int) -> float:
         """
         Calculate position percentage using arc length along the racing line.
@@ -588,55 +666,13 @@ class PositionTrackerV2:
             return 0.0
 
         # STEP 1: Find closest point on racing line to red dot
-        min_distance = float('inf')
-        closest_idx = 0
-
-        for i, (px, py) in enumerate(self.track_path):
-            dx = dot_x - px
-            dy = dot_y - py
-            distance = dx*dx + dy*dy  # Squared distance (faster, no sqrt needed)
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_idx = i
+        closest_idx = self._find_closest_path_index(dot_x, dot_y)
 
         # STEP 2: Use cached start_idx (set when lap started via reset_for_new_lap())
 
         # STEP 3: Calculate arc length from start to current position
-        arc_length = 0.0
-
-        if closest_idx >= self.start_idx:
-            # Normal case: current position is ahead of start
-            for i in range(self.start_idx, closest_idx):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                arc_length += np.sqrt(dx*dx + dy*dy)
-        else:
-            # Wraparound case: we've passed the end of the path array
-            # Go from start_idx to end, then from 0 to closest_idx
-            for i in range(self.start_idx, len(self.track_path) - 1):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                arc_length += np.sqrt(dx*dx + dy*dy)
-
-            # Add closing segment (last point to first point)
-            p1 = self.track_path[-1]
-            p2 = self.track_path[0]
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            arc_length += np.sqrt(dx*dx + dy*dy)
-
-            # Add from start to current position
-            for i in range(0, closest_idx):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                arc_length += np.sqrt(dx*dx + dy*dy)
+        # (cumulative-distance lookup, handles wraparound past the end of the path)
+        arc_length = self._calculate_path_distance(self.start_idx, closest_idx)
 
         # STEP 4: Convert to percentage using cached total track length
         if self.total_track_length > 0:
@@ -690,14 +726,7 @@ class PositionTrackerV2:
                 self.start_position = (dot_x, dot_y)
 
                 # Find and cache the start_idx (closest point on track_path to start_position)
-                min_distance = float('inf')
-                for i, (px, py) in enumerate(self.track_path):
-                    dx = dot_x - px
-                    dy = dot_y - py
-                    distance = dx*dx + dy*dy
-                    if distance < min_distance:
-                        min_distance = distance
-                        self.start_idx = i
+                self.start_idx = self._find_closest_path_index(dot_x, dot_y)
 
                 self.lap_just_started = False
 
@@ -728,10 +757,10 @@ class PositionTrackerV2:
         debug_img = map_roi.copy()
 
         # Create mask overlay (show cleaned mask in cyan on original image)
-        mask_overlay = map_roi.copy()
+        # addWeighted writes a new image, so map_roi needs no defensive copy here
         mask_colored = cv2.cvtColor(cleaned_mask, cv2.COLOR_GRAY2BGR)
         mask_colored[cleaned_mask > 0] = [255, 255, 0]  # Cyan for racing line
-        mask_overlay = cv2.addWeighted(mask_overlay, 0.6, mask_colored, 0.4, 0)
+        mask_overlay = cv2.addWeighted(map_roi, 0.6, mask_colored, 0.4, 0)
 
         # Draw the extracted racing line contour in green
         for i in range(len(self.track_path) - 1):
@@ -808,14 +837,17 @@ class PositionTrackerV2:
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Debug artifacts only: fast PNG compression (level 1) over small files
+        png_params = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
         # Save contour visualization
         contour_path = os.path.join(output_dir, f"track_path_debug_{timestamp}.png")
-        cv2.imwrite(contour_path, debug_img)
+        cv2.imwrite(contour_path, debug_img, png_params)
         print(f"      ✅ Saved track path visualization to {contour_path}")
 
         # Save mask overlay visualization
         mask_path = os.path.join(output_dir, f"track_mask_debug_{timestamp}.png")
-        cv2.imwrite(mask_path, mask_overlay)
+        cv2.imwrite(mask_path, mask_overlay, png_params)
         print(f"      ✅ Saved mask overlay visualization to {mask_path}")
 
     def _calculate_path_distance(self, start_idx: int, end_idx: int) -> float:
@@ -834,42 +866,14 @@ class PositionTrackerV2:
         if not self.track_path:
             return 0.0
 
-        total_distance = 0.0
+        cumdist = self.track_path_cumdist
 
         if end_idx >= start_idx:
             # Normal case: no wraparound
-            for i in range(start_idx, end_idx):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                total_distance += np.sqrt(dx*dx + dy*dy)
-        else:
-            # Wraparound case: go from start_idx to end, then from 0 to end_idx
-            # Distance from start_idx to end of path
-            for i in range(start_idx, len(self.track_path) - 1):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                total_distance += np.sqrt(dx*dx + dy*dy)
-
-            # Distance from last point to first point (closing the loop)
-            p1 = self.track_path[-1]
-            p2 = self.track_path[0]
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            total_distance += np.sqrt(dx*dx + dy*dy)
-
-            # Distance from 0 to end_idx
-            for i in range(0, end_idx):
-                p1 = self.track_path[i]
-                p2 = self.track_path[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                total_distance += np.sqrt(dx*dx + dy*dy)
-
-        return total_distance
+            return float(cumdist[end_idx] - cumdist[start_idx])
+
+        # Wraparound case: start_idx to end of path, closing segment, then 0 to end_idx
+        return self._closed_path_length() - float(cumdist[start_idx] - cumdist[end_idx])
     
     def _validate_position(self, raw_position: Optional[float]) -> float:
         """
@@ -891,6 +895,36 @@ class PositionTrackerV2:
         self.last_position = raw_position
         return raw_position
     
+    def validate_position_bulk(self, raw_positions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized equivalent of calling _validate_position() on every element.
+
+        Intended for offline replay of a whole position stream: one NumPy pass
+        instead of a Python call per frame. Mirrors the scalar semantics exactly
+        (currently RAW MODE: missing detections repeat the last known position)
+        and leaves last_position as the scalar path would.
+
+        Args:
+            raw_positions: Raw positions (0-100%), with NaN (or None) for frames
+                           without a detection
+
+        Returns:
+            Array of validated positions, same length as raw_positions
+        """
+        raw = np.asarray(raw_positions, dtype=np.float64).ravel()
+        if raw.size == 0:
+            return raw
+
+        # Forward-fill missing detections: index of the latest valid sample so far
+        valid = ~np.isnan(raw)
+        last_valid_idx = np.maximum.accumulate(np.where(valid, np.arange(raw.size), -1))
+
+        validated = np.where(last_valid_idx >= 0, raw[np.maximum(last_valid_idx, 0)], self.last_position)
+
+        if valid.any():
+            self.last_position = float(validated[-1])
+        return validated
+    
     def reset_for_new_lap(self) -> None:
         """
         Reset position tracking for a new lap.
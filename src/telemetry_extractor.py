@@ -4,14 +4,15 @@ Telemetry extraction module for detecting throttle, brake, and steering values f
 
 import cv2
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 
 class TelemetryExtractor:
     """Extracts telemetry values from ROI images using computer vision."""
     
     @staticmethod
-    def extract_bar_percentage(roi_image: np.ndarray, target_color: str = 'green', orientation: str = 'vertical') -> float:
+    def extract_bar_percentage(roi_image: np.ndarray, target_color: str = 'green', orientation: str = 'vertical',
+                               hsv: Optional[np.ndarray] = None) -> float:
         """
         Extract percentage value from a bar by detecting filled portion.
         Supports both horizontal and vertical bars.
@@ -20,6 +21,7 @@ class TelemetryExtractor:
             roi_image: Cropped image of the bar
             target_color: 'green' for throttle, 'gray' for brake
             orientation: 'vertical' or 'horizontal'
+            hsv: Optional precomputed HSV conversion of roi_image (skips cvtColor)
             
         Returns:
             Percentage value (0.0 to 100.0)
@@ -28,7 +30,8 @@ class TelemetryExtractor:
             return 0.0
             
         # Convert to HSV for better color detection
-        hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
+        if hsv is None:
+            hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
         
         if target_color == 'green':
             # Green AND Yellow color ranges (bars change color when TC activate)
@@ -244,7 +247,7 @@ class TelemetryExtractor:
         return max(-1.0, min(1.0, normalized_position))
     
     @staticmethod
-    def extract_tc_active(roi_image: np.ndarray) -> int:
+    def extract_tc_active(roi_image: np.ndarray, hsv: Optional[np.ndarray] = None) -> int:
         """
         Detect if traction control (TC) is active by checking for yellow/orange color in throttle bar.
         TC activation causes the throttle bar to change from green to yellow/orange.
@@ -254,6 +257,7 @@ class TelemetryExtractor:
         
         Args:
             roi_image: Cropped image of the throttle bar
+            hsv: Optional precomputed HSV conversion of roi_image (skips cvtColor)
             
         Returns:
             1 if TC is active (yellow/orange detected with throttle present), 0 otherwise
@@ -262,7 +266,8 @@ class TelemetryExtractor:
             return 0
         
         # Convert to HSV for color detection
-        hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
+        if hsv is None:
+            hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
         
         # Yellow/Orange range (same as used in extract_bar_percentage for TC detection)
         lower_yellow = np.array([15, 100, 100])
@@ -290,13 +295,14 @@ class TelemetryExtractor:
                     total_throttle_pixels >= total_pixels_threshold) else 0
     
     @staticmethod
-    def extract_abs_active(roi_image: np.ndarray) -> int:
+    def extract_abs_active(roi_image: np.ndarray, hsv: Optional[np.ndarray] = None) -> int:
         """
         Detect if ABS is active by checking for orange/yellow color in brake bar.
         ABS activation causes the brake bar to change from red to orange/yellow.
         
         Args:
             roi_image: Cropped image of the brake bar
+            hsv: Optional precomputed HSV conversion of roi_image (skips cvtColor)
             
         Returns:
             1 if ABS is active (orange detected), 0 otherwise
@@ -305,7 +311,8 @@ class TelemetryExtractor:
             return 0
         
         # Convert to HSV for color detection
-        hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
+        if hsv is None:
+            hsv = cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
 
         # Orange/Yellow range (same as used in extract_bar_percentage for ABS detection)
         # ADJUSTED: Lowered V threshold from 100 → 50 to detect dim ABS activation
@@ -331,11 +338,34 @@ class TelemetryExtractor:
         Returns:
             Dictionary with extracted values including TC and ABS activation status
         """
+        throttle_roi = roi_dict['throttle']
+        brake_roi = roi_dict['brake']
+        
+        # Throttle and brake ROIs are each read twice (bar fill + TC/ABS),
+        # so convert them to HSV once and share the result
+        throttle_hsv = self._to_hsv(throttle_roi)
+        brake_hsv = self._to_hsv(brake_roi)
+        
         return {
-            'throttle': self.extract_bar_percentage(roi_dict['throttle'], 'green', 'horizontal'),
-            'brake': self.extract_bar_percentage(roi_dict['brake'], 'red', 'horizontal'),
+            'throttle': self.extract_bar_percentage(throttle_roi, 'green', 'horizontal', hsv=throttle_hsv),
+            'brake': self.extract_bar_percentage(brake_roi, 'red', 'horizontal', hsv=brake_hsv),
             'steering': self.extract_steering_position(roi_dict['steering']),
-            'tc_active': self.extract_tc_active(roi_dict['throttle']),
-            'abs_active': self.extract_abs_active(roi_dict['brake'])
+            'tc_active': self.extract_tc_active(throttle_roi, hsv=throttle_hsv),
+            'abs_active': self.extract_abs_active(brake_roi, hsv=brake_hsv)
         }
+    
+    @staticmethod
+    def _to_hsv(roi_image: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Convert an ROI to HSV, or return None for an empty ROI.
+        
+        Args:
+            roi_image: Cropped BGR image
+            
+        Returns:
+            HSV image, or None if roi_image is None/empty
+        """
+        if roi_image is None or roi_image.size == 0:
+            return None
+        return cv2.cvtColor(roi_image, cv2.COLOR_BGR2HSV)
 
@@ -6,6 +6,7 @@ Works for ANY digit-based telemetry: lap numbers, speed, gear, lap times, etc.
 Just provide different template directories for different HUD elements.
 """
 
+import os
 import cv2
 import numpy as np
 from typing import Optional, Dict
@@ -347,6 +348,11 @@ def calibrate_lap_templates(video_path: str, roi_config: dict,
     # Track which digits we've captured
     captured_digits = set()
     
+    # Debug images go to templates/debug_lap/ (prefix built once, not per frame)
+    debug_dir = Path('templates/debug_lap')
+    debug_dir.mkdir(parents=True, exist_ok=True)
+    debug_prefix = os.fspath(debug_dir) + os.sep + 'frame'
+    
     for frame_num, lap_number in sorted(sample_frames.items()):
         cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
         ret, frame = cap.read()
@@ -359,10 +365,8 @@ def calibrate_lap_templates(video_path: str, roi_config: dict,
         lap_roi = frame[y:y+h, x:x+w]
         
         # Save debug image
-        debug_dir = Path('templates/debug_lap')
-        debug_dir.mkdir(parents=True, exist_ok=True)
-        debug_path = debug_dir / f"frame{frame_num}_lap{lap_number}.png"
-        cv2.imwrite(str(debug_path), lap_roi)
+        debug_path = f"{debug_prefix}{frame_num}_lap{lap_number}.png"
+        cv2.imwrite(debug_path, lap_roi, [cv2.IMWRITE_PNG_COMPRESSION, 1])
         
         print(f"📷 Frame {frame_num}: Lap {lap_number}")
         print(f"   Saved debug image: {debug_path}")
@@ -399,12 +403,11 @@ def calibrate_lap_templates(video_path: str, roi_config: dict,
 
 if __name__ == '__main__':
     # Example: Run calibration
-    import yaml
+    from src.config_loader import load_yaml
     
     print("=== Template Matcher Calibration Tool ===\n")
     
-    with open('config/roi_config.yaml', 'r') as f:
-        roi_config = yaml.safe_load(f)
+    roi_config = load_yaml('config/roi_config.yaml')
     
     # TODO: Find frames in your video showing different lap numbers
     sample_frames = {
@@ -4,22 +4,29 @@ Video processing module for extracting frames and ROI regions from ACC gameplay
 
 import cv2
 import numpy as np
-from typing import Generator, Dict, Tuple
+from typing import Generator, Dict, List, Optional, Tuple
 
 
 class VideoProcessor:
     """Handles video loading and frame extraction."""
     
-    def __init__(self, video_path: str, roi_config: Dict):
+    def __init__(self, video_path: str, roi_config: Dict, hw_accel: bool = False):
         """
         Initialize video processor.
         
         Args:
             video_path: Path to the input video file
             roi_config: Dictionary containing ROI coordinates for throttle, brake, steering
+            hw_accel: Request hardware-accelerated decoding (default: False).
+                      GPU decoders convert to BGR through a different path, so
+                      pixel values can shift slightly from the software decoder
+                      the HSV/OCR thresholds were tuned on. Off unless verified
+                      on real footage.
         """
         self.video_path = video_path
         self.roi_config = roi_config
+        self.hw_accel = hw_accel
+        self.hw_acceleration = 0  # cv2.VIDEO_ACCELERATION_* actually in use (0 = software)
         self.cap = None
         self.fps = None
         self.frame_count = None
@@ -32,16 +39,58 @@ class VideoProcessor:
         Returns:
             True if video opened successfully, False otherwise
         """
-        self.cap = cv2.VideoCapture(self.video_path)
+        if self.hw_accel:
+            self.cap = self._open_hw_capture(self.video_path)
+        else:
+            self.cap = cv2.VideoCapture(self.video_path)
         
         if not self.cap.isOpened():
             return False
+        
+        if self.hw_accel:
+            # Report what the backend actually chose - the request is only a hint
+            hw_prop = getattr(cv2, 'CAP_PROP_HW_ACCELERATION', None)
+            self.hw_acceleration = int(self.cap.get(hw_prop)) if hw_prop is not None else 0
+            if self.hw_acceleration:
+                print(f"✅ Hardware video decoding active (VIDEO_ACCELERATION type {self.hw_acceleration})")
+            else:
+                print("ℹ️  Hardware video decoding unavailable, using software decoding")
             
         self.fps = self.cap.get(cv2.CAP_PROP_FPS)
         self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         
         return True
     
+    @staticmethod
+    def _open_hw_capture(video_path: str) -> cv2.VideoCapture:
+        """
+        Open a capture, requesting hardware-accelerated FFMPEG decoding.
+        
+        Decoding dominates per-frame cost on H.264/H.265 recordings. When the
+        OpenCV build and the host support it (VA-API, NVDEC, ...), FFMPEG can
+        decode on the GPU. Otherwise this falls back to a plain software open.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            cv2.VideoCapture (check isOpened() for success)
+        """
+        hw_accel = getattr(cv2, 'CAP_PROP_HW_ACCELERATION', None)
+        if hw_accel is not None:
+            try:
+                cap = cv2.VideoCapture(
+                    video_path, cv2.CAP_FFMPEG,
+                    [hw_accel, cv2.VIDEO_ACCELERATION_ANY]
+                )
+                if cap.isOpened():
+                    return cap
+                cap.release()
+            except cv2.error:
+                pass
+        
+        return cv2.VideoCapture(video_path)
+    
     def extract_roi(self, frame: np.ndarray, roi_name: str) -> np.ndarray:
         """
         Extract a specific ROI from a frame.
@@ -57,10 +106,64 @@ class VideoProcessor:
         x, y, w, h = roi['x'], roi['y'], roi['width'], roi['height']
         return frame[y:y+h, x:x+w]
     
-    def process_frames(self) -> Generator[Tuple[int, float, Dict[str, np.ndarray]], None, None]:
+    def sample_rois(self, frame_indices: List[int], roi_name: str,
+                    max_grab_gap: int = 60) -> List[np.ndarray]:
+        """
+        Extract one ROI from several frames, in ascending frame order.
+        
+        grab() still decodes every frame it passes; only the BGR conversion in
+        retrieve() is skipped. So walking forward is only cheaper than seeking
+        when samples are close together. A seek re-decodes from the previous
+        keyframe (typically tens of frames for H.264), so gaps larger than
+        max_grab_gap are crossed with a seek, and sparse samples are read
+        with one seek each.
+        
+        Args:
+            frame_indices: Frame numbers to sample (any order, duplicates ignored)
+            roi_name: Name of ROI to extract from each sampled frame
+            max_grab_gap: Largest gap (in frames) to cross with grab() instead
+                          of a seek
+            
+        Returns:
+            List of ROI images in ascending frame order (frames past the end
+            of the video are skipped)
+        """
+        if self.cap is None:
+            raise RuntimeError("Video not opened. Call open_video() first.")
+        
+        rois = []
+        next_frame = None  # Index of the frame the next grab() returns
+        
+        for target in sorted(set(frame_indices)):
+            if next_frame is None or target - next_frame > max_grab_gap:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                next_frame = target
+            
+            # Walk forward through the (short) gap, then grab the target itself
+            while next_frame <= target:
+                if not self.cap.grab():
+                    return rois  # Past the end of the video
+                next_frame += 1
+            
+            ret, frame = self.cap.retrieve()
+            if ret:
+                rois.append(self.extract_roi(frame, roi_name))
+        
+        return rois
+    
+    def process_frames(self, stride: int = 1,
+                       roi_names: Optional[List[str]] = None) -> Generator[Tuple[int, float, Dict[str, np.ndarray]], None, None]:
         """
         Generator that yields frame data with ROI regions.
         
+        Args:
+            stride: Yield every Nth frame (default: 1 = every frame). Skipped
+                    frames are only grabbed, never decoded to BGR, which makes
+                    quick smoke runs over long videos much cheaper.
+            roi_names: Only extract these ROIs (default: throttle, brake, steering,
+                       plus track_map if configured). Use when a caller needs
+                       a single ROI, e.g. ['track_map'] for position tracking.
+        
         Yields:
             Tuple of (frame_number, timestamp, roi_dict)
             where roi_dict contains {'throttle': roi_img, 'brake': roi_img, 'steering': roi_img, 'track_map': roi_img}
@@ -68,9 +171,26 @@ class VideoProcessor:
         if self.cap is None:
             raise RuntimeError("Video not opened. Call open_video() first.")
         
+        if stride < 1:
+            raise ValueError(f"stride must be >= 1, got {stride}")
+        
+        if roi_names is None:
+            roi_names = ['throttle', 'brake', 'steering']
+            
+            # Add track_map ROI if available in config
+            if 'track_map' in self.roi_config:
+                roi_names.append('track_map')
+        
         frame_num = 0
         
         while True:
+            if frame_num % stride:
+                # Skipped frame: advance the decoder without BGR conversion
+                if not self.cap.grab():
+                    break
+                frame_num += 1
+                continue
+            
             ret, frame = self.cap.read()
             
             if not ret:
@@ -81,16 +201,8 @@ class VideoProcessor:
             
             timestamp = frame_num / self.fps
             
-            # Extract all ROIs
-            roi_dict = {
-                'throttle': self.extract_roi(frame, 'throttle'),
-                'brake': self.extract_roi(frame, 'brake'),
-                'steering': self.extract_roi(frame, 'steering')
-            }
-            
-            # Add track_map ROI if available in config
-            if 'track_map' in self.roi_config:
-                roi_dict['track_map'] = self.extract_roi(frame, 'track_map')
+            # Extract requested ROIs
+            roi_dict = {name: self.extract_roi(frame, name) for name in roi_names}
             
             yield frame_num, timestamp, roi_dict
             frame_num += 1
@@ -1,6 +1,6 @@
 """Video processing service for telemetry extraction."""
 
-import yaml
+import asyncio
 import time
 import cv2
 from pathlib import Path
@@ -13,11 +13,17 @@ from ...telemetry_extractor import TelemetryExtractor
 from ...lap_detector import LapDetector
 from ...position_tracker_v2 import PositionTrackerV2
 from ...interactive_visualizer import InteractiveTelemetryVisualizer
+from ...config_loader import load_yaml
 
 from ..config import settings
 from ..models import VideoMetadata, LapMetadata
 from .storage import StorageService
 
+# Caps how many videos are processed at once. Each job is CPU-bound and runs
+# in a worker thread (with its own Tesseract engine), so this bounds CPU and
+# memory use rather than the number of accepted jobs.
+_processing_slots = asyncio.Semaphore(settings.max_concurrent_jobs)
+
 
 class VideoProcessingService:
     """Handles video processing and telemetry extraction."""
@@ -28,8 +34,7 @@ class VideoProcessingService:
 
     def load_roi_config(self) -> dict:
         """Load ROI configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml(self.config_path)
 
     async def process_video(
         self,
@@ -41,6 +46,11 @@ class VideoProcessingService:
         """
         Process a video and extract telemetry data.
 
+        The frame loop is blocking and CPU-bound, so it runs in a worker thread
+        to keep the event loop (and the job status endpoints) responsive. At
+        most settings.max_concurrent_jobs videos are processed at once; further
+        jobs wait for a free slot.
+
         Args:
             video_path: Path to the video file
             video_name: Sanitized name for output directory
@@ -53,6 +63,23 @@ class VideoProcessingService:
             FileNotFoundError: If video file doesn't exist
             ValueError: If video cannot be opened
         """
+        async with _processing_slots:
+            return await asyncio.to_thread(
+                self._process_video_blocking,
+                video_path,
+                video_name,
+                has_overlay,
+                progress_callback
+            )
+
+    def _process_video_blocking(
+        self,
+        video_path: str,
+        video_name: str,
+        has_overlay: bool,
+        progress_callback: Optional[Callable[[int, str], None]]
+    ) -> VideoMetadata:
+        """Synchronous implementation of process_video (runs in a worker thread)."""
         video_path_obj = Path(video_path)
 
         if not video_path_obj.exists():
@@ -96,18 +123,8 @@ class VideoProcessingService:
                     progress_callback(10, "Extracting track path from minimap...")
 
                 sample_frames = [0, 50, 100, 150, 200, 250, 500, 750, 1000, 1250, 1500]
-                map_rois = []
-
-                for sample_frame_num in sample_frames:
-                    if sample_frame_num >= video_info['frame_count']:
-                        break
-
-                    processor.cap.set(cv2.CAP_PROP_POS_FRAMES, sample_frame_num)
-                    ret, frame = processor.cap.read()
-
-                    if ret:
-                        map_roi = processor.extract_roi(frame, 'track_map')
-                        map_rois.append(map_roi)
+                sample_frames = [f for f in sample_frames if f < video_info['frame_count']]
+                map_rois = processor.sample_rois(sample_frames, 'track_map')
 
                 processor.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
 
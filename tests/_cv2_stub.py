@@ -0,0 +1,38 @@
+"""
+Minimal stand-in for cv2, used by the tests when OpenCV is not installed.
+
+Only exposes what PositionTrackerV2 touches outside the image-processing
+paths (constants and trivial helpers), so the pure-Python logic (position
+validation, path math) can be unit tested without OpenCV. Much lighter than
+a MagicMock, which creates a child mock on every attribute access.
+"""
+
+import numpy as np
+
+# Constants referenced by the tracker
+MORPH_ELLIPSE = 2
+COLOR_BGR2HSV = 40
+COLOR_GRAY2BGR = 8
+CV_32S = 4
+CC_STAT_AREA = 4
+RETR_EXTERNAL = 0
+CHAIN_APPROX_NONE = 1
+CHAIN_APPROX_SIMPLE = 2
+FONT_HERSHEY_SIMPLEX = 0
+IMWRITE_PNG_COMPRESSION = 16
+
+
+def getStructuringElement(shape, ksize):
+    return np.ones((ksize[1], ksize[0]), dtype=np.uint8)
+
+
+def cvtColor(src, code):
+    return np.zeros(src.shape[:2] + (3,), dtype=np.uint8)
+
+
+def inRange(src, lowerb, upperb):
+    return np.zeros(src.shape[:2], dtype=np.uint8)
+
+
+def countNonZero(src):
+    return int(np.count_nonzero(src))
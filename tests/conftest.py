@@ -0,0 +1,20 @@
+"""
+Shared pytest setup for the test suite.
+
+Installs tests/_cv2_stub.py as cv2 when OpenCV is not installed, once for
+the whole session and before any test module imports the tracker. With
+OpenCV available the real module is used and nothing is patched.
+"""
+
+import importlib.util
+import os
+import sys
+
+try:
+    import cv2  # noqa: F401
+except ImportError:
+    _stub_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cv2_stub.py')
+    _spec = importlib.util.spec_from_file_location('cv2', _stub_path)
+    _cv2_stub = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_cv2_stub)
+    sys.modules['cv2'] = _cv2_stub
@@ -17,15 +17,11 @@ class TestPositionTrackerV2(unittest.TestCase):
         # Manually set up a simple square track path
         # 0,0 -> 100,0 -> 100,100 -> 0,100 -> 0,0
         # Total length = 400
-        self.tracker.track_path = []
-        # Bottom edge
-        for x in range(0, 100): self.tracker.track_path.append((x, 0))
-        # Right edge
-        for y in range(0, 100): self.tracker.track_path.append((100, y))
-        # Top edge
-        for x in range(100, 0, -1): self.tracker.track_path.append((x, 100))
-        # Left edge
-        for y in range(100, 0, -1): self.tracker.track_path.append((0, y))
+        bottom = np.stack([np.arange(0, 100), np.zeros(100)], axis=1)
+        right = np.stack([np.full(100, 100), np.arange(0, 100)], axis=1)
+        top = np.stack([np.arange(100, 0, -1), np.full(100, 100)], axis=1)
+        left = np.stack([np.zeros(100), np.arange(100, 0, -1)], axis=1)
+        self.tracker.track_path = np.concatenate([bottom, right, top, left]).astype(np.int16)
         
         self.tracker.total_path_pixels = len(self.tracker.track_path)
         self.tracker.total_track_length = 400.0 # Approx
@@ -106,6 +102,44 @@ class TestPositionTrackerV2(unittest.TestCase):
         self.assertEqual(val_pos, 0.5) # Should accept it
         self.assertEqual(self.tracker.last_position, 0.5)
 
+    def test_track_path_np_cache(self):
+        """Test that the ndarray path is cached and rebuilt when the path changes."""
+        path_np = self.tracker.track_path_np
+        self.assertEqual(path_np.shape, (400, 2))
+        self.assertEqual(path_np.dtype, np.int32)
+        self.assertIs(self.tracker.track_path_np, path_np) # Reused while unchanged
+        
+        # Growing the list in place must invalidate the cache
+        self.tracker.track_path.append((0, 0))
+        self.assertEqual(self.tracker.track_path_np.shape, (401, 2))
+        
+        # Replacing the path must invalidate the cache
+        self.tracker.track_path = [(1, 2), (3, 4)]
+        self.assertEqual(self.tracker.track_path_np.tolist(), [[1, 2], [3, 4]])
+
+    def test_path_distance_lookup(self):
+        """Test cumulative-distance arc lengths, including wraparound."""
+        self.assertAlmostEqual(self.tracker._closed_path_length(), 400.0)
+        self.assertAlmostEqual(self.tracker._calculate_path_distance(0, 100), 100.0)
+        self.assertAlmostEqual(self.tracker._calculate_path_distance(100, 300), 200.0)
+        # 300 is (0, 100): left edge plus closing segment back to (0, 0)
+        self.assertAlmostEqual(self.tracker._calculate_path_distance(300, 0), 100.0)
+        self.assertAlmostEqual(self.tracker._calculate_path_distance(300, 50), 150.0)
+
+    def test_validate_position_bulk_parity(self):
+        """Test that bulk validation matches the per-frame scalar path."""
+        raw = [None, 10.0, 10.5, None, None, 12.0, 95.0, None, 1.0]
+        
+        self.tracker.last_position = 7.0
+        scalar = [self.tracker._validate_position(p) for p in raw]
+        scalar_last = self.tracker.last_position
+        
+        self.tracker.last_position = 7.0
+        bulk = self.tracker.validate_position_bulk(raw)
+        
+        np.testing.assert_allclose(bulk, scalar)
+        self.assertEqual(self.tracker.last_position, scalar_last)
+
     def test_spike_removal(self):
         """Test that sharp spikes (start/finish line artifacts) are removed."""
         # Create a path with a spike
@@ -0,0 +1,153 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cv2
+if not hasattr(cv2, 'VideoWriter'):
+    # Only the lightweight stub is installed (see conftest.py); needs real OpenCV
+    raise unittest.SkipTest("requires OpenCV")
+
+from video_processor import VideoProcessor
+
+NUM_FRAMES = 30
+FPS = 30.0
+# Frame i is filled with gray level i * LEVEL_STEP, so every ROI identifies its frame
+LEVEL_STEP = 8
+
+
+class TestVideoProcessor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Short MJPG clip: flat frames compress losslessly enough to read levels back
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.video_path = os.path.join(cls.temp_dir, 'clip.avi')
+        writer = cv2.VideoWriter(cls.video_path, cv2.VideoWriter_fourcc(*'MJPG'), FPS, (64, 48))
+        for i in range(NUM_FRAMES):
+            writer.write(np.full((48, 64, 3), i * LEVEL_STEP, dtype=np.uint8))
+        writer.release()
+
+        cls.roi_config = {
+            'throttle': {'x': 0, 'y': 0, 'width': 16, 'height': 8},
+            'brake': {'x': 16, 'y': 0, 'width': 16, 'height': 8},
+            'steering': {'x': 32, 'y': 0, 'width': 16, 'height': 8},
+            'track_map': {'x': 8, 'y': 16, 'width': 32, 'height': 24},
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.processor = VideoProcessor(self.video_path, self.roi_config)
+        self.assertTrue(self.processor.open_video())
+
+    def tearDown(self):
+        self.processor.close()
+
+    def assertFromFrame(self, roi, frame_num):
+        """Assert an ROI (or frame) carries the gray level written for frame_num."""
+        self.assertGreater(roi.size, 0)
+        self.assertAlmostEqual(float(roi.mean()), frame_num * LEVEL_STEP, delta=3.0)
+
+    def test_process_frames_default(self):
+        """Test that every frame is yielded with all configured ROIs."""
+        frames = list(self.processor.process_frames())
+
+        self.assertEqual([f[0] for f in frames], list(range(NUM_FRAMES)))
+        for frame_num, timestamp, roi_dict in frames:
+            self.assertAlmostEqual(timestamp, frame_num / FPS)
+            self.assertEqual(set(roi_dict), {'throttle', 'brake', 'steering', 'track_map'})
+            self.assertEqual(roi_dict['track_map'].shape, (24, 32, 3))
+            self.assertFromFrame(roi_dict['throttle'], frame_num)
+
+    def test_process_frames_stride(self):
+        """Test that stride yields every Nth frame with that frame's content."""
+        frame_nums = []
+        for frame_num, timestamp, roi_dict in self.processor.process_frames(stride=4):
+            frame_nums.append(frame_num)
+            self.assertAlmostEqual(timestamp, frame_num / FPS)
+            self.assertFromFrame(roi_dict['brake'], frame_num)
+            self.assertFromFrame(self.processor.current_frame, frame_num)
+
+        self.assertEqual(frame_nums, list(range(0, NUM_FRAMES, 4)))
+
+    def test_process_frames_invalid_stride(self):
+        """Test that a stride below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            next(self.processor.process_frames(stride=0))
+
+    def test_process_frames_roi_names(self):
+        """Test that roi_names limits extraction to the requested ROIs."""
+        frames = list(self.processor.process_frames(stride=10, roi_names=['track_map']))
+
+        self.assertEqual([f[0] for f in frames], [0, 10, 20])
+        for frame_num, _, roi_dict in frames:
+            self.assertEqual(list(roi_dict), ['track_map'])
+            self.assertFromFrame(roi_dict['track_map'], frame_num)
+
+    def test_process_frames_default_rois_without_track_map(self):
+        """Test that track_map is only extracted by default when configured."""
+        config = {name: roi for name, roi in self.roi_config.items() if name != 'track_map'}
+        processor = VideoProcessor(self.video_path, config)
+        self.assertTrue(processor.open_video())
+        try:
+            _, _, roi_dict = next(processor.process_frames())
+        finally:
+            processor.close()
+
+        self.assertEqual(set(roi_dict), {'throttle', 'brake', 'steering'})
+
+    def test_hw_accel_off_by_default(self):
+        """Test that hardware decoding is only requested when opted in."""
+        with mock.patch.object(VideoProcessor, '_open_hw_capture') as open_hw:
+            processor = VideoProcessor(self.video_path, self.roi_config)
+            self.assertTrue(processor.open_video())
+            processor.close()
+
+        open_hw.assert_not_called()
+        self.assertEqual(processor.hw_acceleration, 0)
+
+    def test_hw_accel_opt_in(self):
+        """Test that an opted-in capture opens and decodes the same frames (software fallback included)."""
+        processor = VideoProcessor(self.video_path, self.roi_config, hw_accel=True)
+        self.assertTrue(processor.open_video())
+        try:
+            self.assertEqual(processor.frame_count, NUM_FRAMES)
+            self.assertGreaterEqual(processor.hw_acceleration, 0)
+            for frame_num, _, roi_dict in processor.process_frames(stride=10):
+                self.assertFromFrame(roi_dict['throttle'], frame_num)
+        finally:
+            processor.close()
+
+    def test_sample_rois(self):
+        """Test that sampling returns sorted, de-duplicated frames and skips frames past the end."""
+        rois = self.processor.sample_rois([20, 5, 5, 12, NUM_FRAMES + 10], 'track_map')
+
+        self.assertEqual(len(rois), 3)
+        for roi, frame_num in zip(rois, [5, 12, 20]):
+            self.assertEqual(roi.shape, (24, 32, 3))
+            self.assertFromFrame(roi, frame_num)
+
+        self.assertEqual(self.processor.sample_rois([], 'track_map'), [])
+
+    def test_sample_rois_seek_vs_grab(self):
+        """Test that seeking across gaps and grabbing through them return the same frames."""
+        targets = [3, 4, 17, 26]
+        grabbed = self.processor.sample_rois(targets, 'throttle', max_grab_gap=NUM_FRAMES)
+        seeked = self.processor.sample_rois(targets, 'throttle', max_grab_gap=0)
+
+        self.assertEqual(len(grabbed), len(targets))
+        self.assertEqual(len(seeked), len(targets))
+        for grab_roi, seek_roi, frame_num in zip(grabbed, seeked, targets):
+            self.assertFromFrame(grab_roi, frame_num)
+            self.assertFromFrame(seek_roi, frame_num)
+
+if __name__ == '__main__':
+    unittest.main()